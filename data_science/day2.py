@@ -233,6 +233,82 @@ pivot = merged.pivot_table(values="Score", index="Age", aggfunc="mean")
 print("\nPivot Table (Average Score by Age):\n", pivot)
 # Output: pivot table showing average Score by Age
 
+# ==============================================================
+# 🧽 10. VECTORIZED TEXT CLEANING (WHOLE COLUMNS AT ONCE)
+# ==============================================================
+# df["col"].apply(clean_text) calls a Python function once per row.
+# Chaining .str.replace() / .str.strip() / .str.lower() is NOT faster without
+# pyarrow: each .str step is another Python loop over the rows.
+# Instead, join the whole column into ONE string and clean it in one go:
+#   1️⃣ remove punctuation  2️⃣ collapse spaces  3️⃣ lowercase
+# with str.replace() / str.lower() → each is ONE pass in C,
+# then split it back into rows (same trick as TextCleaner in python/day5.py).
+# (same rules as clean_text() from python/day5.py → identical output)
+
+import re
+
+SEPARATOR = "\x00"   # joins the rows; not a word character and not a space
+
+def _clean_texts(texts):
+    """Cleans a list of strings in a few C-level passes over the joined text."""
+    joined = SEPARATOR.join(texts)
+    if joined.count(SEPARATOR) != len(texts) - 1:   # a row contains "\x00" → row by row
+        return [" ".join(re.sub(r"[^\w\s]", "", text).split()).lower() for text in texts]
+    # Same character classes as re's \w (isalnum or "_") and \s (isspace):
+    # punctuation → deleted, any whitespace → " " (one replace() per distinct char)
+    for char in set(joined):
+        if char.isalnum() or char == "_" or char == SEPARATOR or char == " ":
+            continue
+        joined = joined.replace(char, " " if char.isspace() else "")
+    while "  " in joined:                          # runs of spaces → one space
+        joined = joined.replace("  ", " ")
+    joined = joined.replace(" " + SEPARATOR, SEPARATOR).replace(SEPARATOR + " ", SEPARATOR)
+    return joined.strip(" ").lower().split(SEPARATOR)   # strip() of every row, lowercase
+
+def clean_text_series(values):
+    """Cleans a pandas Series or NumPy string array like clean_text(), without .apply()."""
+    if isinstance(values, np.ndarray):
+        cleaned = _clean_texts([str(value) for value in values])
+        return np.array(cleaned, dtype=str if values.dtype.kind == "U" else object)
+    rows = values.tolist()
+    cleaned = iter(_clean_texts([row for row in rows if isinstance(row, str)]))
+    return pd.Series([next(cleaned) if isinstance(row, str) else np.nan for row in rows],
+                     index=values.index, name=values.name, dtype=values.dtype)
+
+def clean_text_chunks(csv_path, column, chunksize=100_000):
+    """Reads a big CSV chunk by chunk and yields each chunk with `column` cleaned."""
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+        chunk[column] = clean_text_series(chunk[column])
+        yield chunk
+
+reviews = pd.Series(["  Great, product!! ", "NOT   worth it...", np.nan])
+print("\nCleaned Reviews:\n", clean_text_series(reviews))
+# Output:
+# 0    great product
+# 1    not worth it
+# 2              NaN
+# dtype: str
+
+print(clean_text_series(np.array(["Hello, World!", "  Data   SCIENCE "])))
+# Output: ['hello world' 'data science']
+
+# Check it really beats .apply() (and gives the same result):
+import timeit
+
+def clean_text(text):
+    text = re.sub(r"[^\w\s]", "", text)
+    return " ".join(text.split()).lower()
+
+many_reviews = pd.Series(["  Great, product!! ", "NOT   worth it...", "Ok."] * 100_000)
+assert clean_text_series(many_reviews).equals(many_reviews.apply(clean_text))
+print("apply:", round(timeit.timeit(lambda: many_reviews.apply(clean_text), number=1), 2), "s",
+      "| vectorized:", round(timeit.timeit(lambda: clean_text_series(many_reviews), number=1), 2), "s")
+# Output (approx.): apply: 0.4 s | vectorized: 0.16 s
+
+# Chunked mode → only `chunksize` rows are in memory at a time:
+# for i, chunk in enumerate(clean_text_chunks("reviews.csv", "text")):
+#     chunk.to_csv("reviews_clean.csv", mode="a", header=(i == 0), index=False)
+
 # ==============================================================
 # 💡 INTERVIEW & PRACTICAL TIPS
 # ==============================================================
@@ -254,6 +330,10 @@ print("\nPivot Table (Average Score by Age):\n", pivot)
 #   - df.groupby("col").mean(), sum(), agg()
 #   - df.pivot_table() → Excel-style summary table
 #
+# ✅ Text Columns:
+#   - df["col"].str.replace/.lower() → vectorized, avoid .apply(func)
+#   - pd.read_csv(..., chunksize=N) → process huge files piece by piece
+#
 # 🧠 Real-world Tip:
 # Always inspect data first:
 #   df.info(), df.describe(), df.isnull().sum()
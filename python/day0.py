@@ -145,7 +145,154 @@ print(sys.getsizeof(text))  # Strings also take memory for metadata
 
 
 # --------------------------------------------------
-# 🔹 8. WHY THIS MATTERS (REAL-WORLD USE)
+# 🔹 8. DEEP MEMORY SIZE – BEYOND sys.getsizeof()
+# --------------------------------------------------
+# sys.getsizeof() is SHALLOW: for a list it counts the list itself
+# (its pointers), NOT the objects inside it.
+
+users = [{"name": "Asha", "tags": ["admin", "dev"]} for _ in range(3)]
+print(sys.getsizeof(users))   # Output: 88 → only the list, not the 3 dicts inside
+
+# deep_sizeof() follows every reference (like GC does) and adds up:
+# - containers (list, tuple, dict, set...) and the objects inside them,
+# - object attributes (__dict__ and __slots__),
+# - NumPy arrays (their data buffer, views counted once via .base),
+# - pandas Series / DataFrames (the arrays inside their blocks).
+# Shared objects are counted ONCE. Classes, functions and modules are skipped
+# (they belong to the program, not to the data).
+# max_objects / max_depth stop the walk on huge graphs (report.truncated = True).
+
+import types
+from collections import deque
+
+_NOT_DATA = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+             types.MethodType, types.CodeType, types.FrameType)
+
+
+def _own_size(obj):
+    """Bytes of obj itself (without the objects it points to)."""
+    module = type(obj).__module__
+    if module.startswith("pandas"):
+        return object.__sizeof__(obj)   # pandas' __sizeof__ already includes its data
+    if module.startswith("pyarrow"):
+        return getattr(obj, "nbytes", 0) or sys.getsizeof(obj)   # Arrow buffers live outside Python
+    return sys.getsizeof(obj)           # NumPy arrays include the buffer they own
+
+
+def _references(obj):
+    """Yields (path step, child) for every object that obj holds on to."""
+    if isinstance(obj, (str, bytes, bytearray, int, float, complex, range)):
+        return
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            step = f"[{key!r}]" if isinstance(key, (str, int)) and len(str(key)) <= 30 else "[…]"
+            yield step, key
+            yield step, value
+        return
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        for item in obj:
+            yield "[*]", item
+        return
+    if type(obj).__module__.startswith("numpy"):
+        if getattr(obj, "base", None) is not None:
+            yield ".base", obj.base                 # a view → the real buffer lives in .base
+        if getattr(getattr(obj, "dtype", None), "hasobject", False) and getattr(obj, "ndim", 0):
+            for item in obj.flat:                   # dtype=object → Python objects inside
+                yield "[*]", item
+        return
+    if type(obj).__module__.startswith("pandas"):
+        if hasattr(obj, "mgr_locs"):                # a Block → the array with its columns
+            yield ".values", obj.values
+        elif isinstance(getattr(obj, "blocks", None), tuple):
+            yield ".blocks", obj.blocks             # a BlockManager → blocks + index/columns
+            yield ".axes", obj.axes
+        for name in ("_ndarray", "_dtype", "_pa_array"):    # pandas arrays (Categorical, strings...)
+            if getattr(obj, name, None) is not None:
+                yield f".{name}", getattr(obj, name)
+    if hasattr(obj, "__dict__"):
+        for name, value in vars(obj).items():
+            yield f".{name}", value
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            value = getattr(obj, name, None)
+            if value is not None and name not in ("__dict__", "__weakref__"):
+                yield f".{name}", value
+
+
+class MemoryReport:
+    """Deep memory usage of an object, with totals by type and by attribute path."""
+
+    def __init__(self, obj, max_objects=1_000_000, max_depth=100, path_depth=3):
+        self.total = self.objects = 0
+        self.truncated = False
+        self.by_type = {}   # type name → [objects, bytes]
+        self.by_path = {}   # "root['users'][*]" → bytes (paths longer than path_depth are rolled up)
+        seen = {id(obj)}
+        queue = deque([(obj, "root", 0, 0)])        # breadth-first → shortest path wins
+        while queue:
+            item, path, depth, steps = queue.popleft()
+            if self.objects >= max_objects:
+                self.truncated = True
+                break
+            size = _own_size(item)
+            self.total += size
+            self.objects += 1
+            row = self.by_type.setdefault(type(item).__qualname__, [0, 0])
+            row[0] += 1
+            row[1] += size
+            self.by_path[path] = self.by_path.get(path, 0) + size
+            if depth >= max_depth:
+                self.truncated = True
+                continue
+            for step, child in _references(item):
+                if id(child) in seen or isinstance(child, _NOT_DATA):
+                    continue
+                seen.add(id(child))
+                child_path = path + step if steps < path_depth else path
+                queue.append((child, child_path, depth + 1, steps + 1))
+
+    def top_types(self, n=5):
+        return sorted(((name, count, size) for name, (count, size) in self.by_type.items()),
+                      key=lambda row: row[2], reverse=True)[:n]
+
+    def top_paths(self, n=5):
+        return sorted(self.by_path.items(), key=lambda row: row[1], reverse=True)[:n]
+
+    def __str__(self):
+        lines = [f"{self.total:,} bytes in {self.objects:,} objects"
+                 + (" (walk stopped early)" if self.truncated else "")]
+        lines += [f"  {name:<12} {count:>7,} objects {size:>12,} bytes"
+                  for name, count, size in self.top_types()]
+        lines += [f"  {path:<30} {size:>12,} bytes" for path, size in self.top_paths()]
+        return "\n".join(lines)
+
+
+def deep_sizeof(obj, max_objects=1_000_000):
+    """Total bytes of obj and everything reachable from it (shared objects once)."""
+    return MemoryReport(obj, max_objects=max_objects).total
+
+print(deep_sizeof(users))     # Output: 1121 → list + 3 dicts + 3 tag lists + the strings
+shared = ["same tags"] * 3
+print(deep_sizeof(shared))    # Output: 138 → one string, counted once (not 3 times)
+print(MemoryReport({"users": users, "ids": list(range(1000))}))
+# Output:
+# 37,467 bytes in 1,016 objects
+#   int            1,000 objects       28,000 bytes
+#   list               5 objects        8,360 bytes
+#   dict               4 objects          736 bytes
+#   ...
+#   root['ids'][*]                       28,000 bytes
+#   root['ids']                           8,108 bytes
+#   ...
+
+# ✅ Tip:
+# - Use deep_sizeof() to size caches and MemoryReport to find what makes an object big.
+# - tracemalloc (standard library) answers the other question: WHERE was memory allocated.
+
+
+# --------------------------------------------------
+# 🔹 9. WHY THIS MATTERS (REAL-WORLD USE)
 # --------------------------------------------------
 # - Explains why copies, memory leaks, and recursion behave the way they do.
 # - Helps in writing memory-efficient code.
@@ -161,4 +308,5 @@ print(sys.getsizeof(text))  # Strings also take memory for metadata
 # 3️⃣ Immutable = new object; Mutable = same object modified.
 # 4️⃣ Garbage Collector automatically clears unused objects.
 # 5️⃣ Memory concepts help you understand recursion, data structures, and performance.
+# 6️⃣ sys.getsizeof() is shallow → deep_sizeof() / MemoryReport follow references.
 # --------------------------------------------------
@@ -153,6 +153,7 @@ print("Factorial of 5:", factorial(5))  # Output: Factorial of 5: 120
 
 # ✅ Tip:
 # Recursion is great for factorial, Fibonacci, and tree/graph traversals.
+# Same arguments again and again? Cache the results → functools.lru_cache or memoize() (day 8).
 
 
 # --------------------------------------------------
@@ -179,6 +179,662 @@ print(word_count)
 """
 
 
+# --------------------------------------------------
+# 🔹 8. SCALING UP – STREAMING, MULTI-CORE WORD FREQUENCY
+# --------------------------------------------------
+# word_frequency() needs the whole sentence in memory and builds a full
+# list of words before counting. For multi-GB logs we instead:
+# 1️⃣ Split the file into byte ranges (each range ends on a newline, so
+#    no word is ever cut in half).
+# 2️⃣ Count every range in its own process (map step).
+# 3️⃣ Merge the partial counters (reduce step).
+# Memory stays flat: we only ever hold one block (1 MB) plus the distinct words.
+
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _chunk_ranges(path, chunks):
+    """Splits a file into (start, end) byte ranges that end on a newline."""
+    size = os.path.getsize(path)
+    step = max(1, size // chunks)
+    ranges = []
+    with open(path, "rb") as file:
+        start = 0
+        while start < size:
+            file.seek(min(start + step, size))
+            file.readline()                # move to the end of the current line
+            end = min(file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _count_lines(lines, counts=None):
+    """Adds the lowercase words of each line to a Counter."""
+    counts = Counter() if counts is None else counts
+    for line in lines:
+        counts.update(word.lower() for word in line.split())
+    return counts
+
+
+def _count_range(path, start, end, encoding="utf-8", block_size=1 << 20):
+    """Counts words in one byte range of a file (runs inside a worker)."""
+    counts = Counter()
+    with open(path, "rb") as file:
+        file.seek(start)
+        pending = b""
+        while start < end:
+            block = file.read(min(block_size, end - start))
+            if not block:
+                break
+            start += len(block)
+            pending += block
+            cut = pending.rfind(b"\n") + 1             # keep the unfinished last line
+            if cut:                                     # one decode + split per block, not per line
+                counts.update(pending[:cut].decode(encoding, errors="replace").lower().split())
+                pending = pending[cut:]
+        counts.update(pending.decode(encoding, errors="replace").lower().split())
+    return counts
+
+
+def word_frequency_stream(source, workers=None, encoding="utf-8"):
+    """Counts words in a file path or an iterable of lines, without loading it all."""
+    if not isinstance(source, (str, os.PathLike)):
+        return dict(_count_lines(source))          # any iterable of lines
+
+    workers = workers or os.cpu_count() or 1
+    ranges = _chunk_ranges(source, workers * 4)    # a few ranges per core balances the load
+    if workers == 1 or len(ranges) <= 1:
+        partials = [_count_range(source, start, end, encoding) for start, end in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = pool.map(_count_range, [source] * len(ranges),
+                                *zip(*ranges), [encoding] * len(ranges))
+    total = Counter()
+    for partial in partials:                       # reduce step
+        total.update(partial)
+    return dict(total)
+
+print(word_frequency_stream(["Hello hello", "world world"]))
+# Output: {'hello': 2, 'world': 2}
+
+# A process pool re-imports this file on some platforms,
+# so the multi-core example lives behind the __main__ guard.
+if __name__ == "__main__":
+    with open("words.txt", "w") as file:
+        file.write("Hello hello world\nworld python\n" * 1000)
+    print(word_frequency_stream("words.txt", workers=2))
+    # Output: {'hello': 2000, 'world': 2000, 'python': 1000}
+
+# ✅ When to use this logic:
+# - Log or corpus files that are too big to read with .read() or .split().
+# - Use Counter.update() to merge partial results from many workers.
+
+
+# --------------------------------------------------
+# 🔹 9. APPROXIMATE COUNTING – HEAVY HITTERS IN FIXED MEMORY
+# --------------------------------------------------
+# A dict keeps ONE entry per distinct word. With millions of distinct
+# URLs / user-agents that dict eats all RAM. When "roughly right" is enough:
+# - Count-Min Sketch → a fixed table of counters (depth rows × width columns).
+#   Each word adds 1 to one counter per row; its estimate is the smallest of
+#   them. Never undercounts; overcounts by at most ε·N with probability 1-δ.
+# - Space-Saving → keeps only k counters for the current top-k words.
+#   A new word replaces the smallest counter and inherits its count as "error".
+# Both are mergeable, so every shard can build its own and combine them later.
+
+import hashlib
+import heapq
+import math
+from array import array
+
+
+class CountMinSketch:
+    """Approximate counts for any word in width × depth fixed counters."""
+
+    def __init__(self, width=2048, depth=4):
+        self.width, self.depth = width, depth
+        self.rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+        self.total = 0
+
+    @classmethod
+    def from_error(cls, epsilon=0.001, delta=0.01):
+        """Sizes the table so overcount ≤ epsilon·N with probability 1 - delta."""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)))
+
+    def _columns(self, word):
+        # hash() changes between processes, blake2b does not → shards stay mergeable
+        digest = hashlib.blake2b(word.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, word, count=1):
+        for row, column in zip(self.rows, self._columns(word)):
+            row[column] += count
+        self.total += count
+
+    def estimate(self, word):
+        return min(row[column] for row, column in zip(self.rows, self._columns(word)))
+
+    def error_bound(self):
+        """Returns (max overcount, probability that the bound holds)."""
+        return math.e / self.width * self.total, 1 - math.exp(-self.depth)
+
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Only sketches with the same width and depth can be merged.")
+        for row, other_row in zip(self.rows, other.rows):
+            for column, value in enumerate(other_row):
+                row[column] += value
+        self.total += other.total
+
+
+class SpaceSaving:
+    """Top-k words using only k counters (each with its max overcount)."""
+
+    def __init__(self, k=100):
+        self.k = k
+        self.counts = {}   # word → [count, error]
+        self._heap = []    # one (count, word) per tracked word; may be out of date
+        self.total = 0
+
+    def add(self, word, count=1):
+        self.total += count
+        entry = self.counts.get(word)
+        if entry is not None:
+            entry[0] += count          # heap entry is fixed lazily at eviction time
+        elif len(self.counts) < self.k:
+            self.counts[word] = [count, 0]
+            heapq.heappush(self._heap, (count, word))
+        else:
+            smallest, victim = self._heap[0]
+            while smallest != self.counts[victim][0]:    # refresh stale heap entries
+                heapq.heapreplace(self._heap, (self.counts[victim][0], victim))
+                smallest, victim = self._heap[0]
+            del self.counts[victim]
+            self.counts[word] = [smallest + count, smallest]
+            heapq.heapreplace(self._heap, (smallest + count, word))
+
+    def _floor(self):
+        """Smallest tracked count (0 while there is still room)."""
+        return min(c for c, _ in self.counts.values()) if len(self.counts) >= self.k else 0
+
+    def top(self, n=10):
+        """Returns [(word, count, error), ...] sorted by count."""
+        ranked = sorted(self.counts.items(), key=lambda item: item[1][0], reverse=True)
+        return [(word, count, error) for word, (count, error) in ranked[:n]]
+
+    def error_bound(self):
+        """Any reported count is at most N / k above the true count."""
+        return self.total / self.k
+
+    def merge(self, other):
+        floor, other_floor = self._floor(), other._floor()
+        merged = {}
+        for word in self.counts.keys() | other.counts.keys():
+            count, error = self.counts.get(word, (floor, floor))
+            other_count, other_error = other.counts.get(word, (other_floor, other_floor))
+            merged[word] = [count + other_count, error + other_error]
+        best = heapq.nlargest(self.k, merged.items(), key=lambda item: item[1][0])
+        self.counts = dict(best)
+        self._heap = [(count, word) for word, (count, _) in best]
+        heapq.heapify(self._heap)
+        self.total += other.total
+
+
+def word_frequency_approx(lines, k=100, width=2048, depth=4):
+    """Streams lines into a (SpaceSaving top-k, CountMinSketch) pair."""
+    top_k, sketch = SpaceSaving(k), CountMinSketch(width, depth)
+    for line in lines:
+        for word in line.split():
+            word = word.lower()
+            top_k.add(word)
+            sketch.add(word)
+    return top_k, sketch
+
+top_k, sketch = word_frequency_approx(["hello world", "hello python hello"], k=2)
+print(top_k.top(2))              # Output: [('hello', 3, 0), ('python', 2, 1)]
+print(sketch.estimate("world"))  # Output: 1
+# ('python', 2, 1) → reported 2, but up to 1 of that may belong to an evicted word.
+
+# ✅ When to use this logic:
+# - Top-N pages / IPs / search terms over endless streams.
+# - Memory is fixed up front: width × depth × 8 bytes + k entries.
+
+
+# --------------------------------------------------
+# 🔹 10. INCREMENTAL WORD COUNTER WITH SNAPSHOTS
+# --------------------------------------------------
+# If a corpus only grows (new lines are appended), recounting it from
+# scratch every night wastes time. WordCounter remembers:
+# - the running counts, and
+# - how many bytes of each file it has already counted,
+# and saves both in a compact binary snapshot. Next run → load the snapshot
+# and count only the new bytes. Counters from other workers can be merged in.
+
+import struct
+
+SNAPSHOT_MAGIC = b"WCNT"
+SNAPSHOT_VERSION = 1
+
+
+def _write_varint(out, number):
+    """Appends a non-negative int using 7 bits per byte (small ints → 1 byte)."""
+    while number >= 0x80:
+        out.append((number & 0x7F) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _read_varint(data, pos):
+    """Reads a varint at data[pos]; returns (number, next_pos)."""
+    number = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, pos
+        shift += 7
+
+
+class WordCounter:
+    """Word counts that grow incrementally and persist between runs."""
+
+    def __init__(self):
+        self.counts = Counter()
+        self.offsets = {}   # file path → bytes already counted
+
+    def add(self, text):
+        """Counts the words of a piece of text."""
+        self.counts.update(word.lower() for word in text.split())
+
+    def add_file(self, path, encoding="utf-8", chunk_size=1 << 20):
+        """Counts only the complete lines appended since the last call."""
+        start = self.offsets.get(path, 0)
+        if os.path.getsize(path) < start:
+            raise ValueError(f"{path} shrank since it was last counted (not append-only).")
+        with open(path, "rb") as file:
+            file.seek(start)
+            pending = b""
+            while True:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    break
+                pending += chunk
+                end = pending.rfind(b"\n") + 1         # keep the unfinished last line
+                if end:
+                    self.add(pending[:end].decode(encoding, errors="replace"))
+                    start += end
+                    pending = pending[end:]
+        self.offsets[path] = start
+
+    def merge(self, other):
+        """Adds the counts of another WordCounter (other files only) or a dict delta."""
+        if isinstance(other, WordCounter):
+            # Offsets only say "bytes 0..offset were counted" → two counters that both
+            # counted a file overlap there, and adding them would count it twice.
+            shared = [path for path, offset in other.offsets.items()
+                      if offset and self.offsets.get(path)]
+            if shared:
+                raise ValueError(f"Both counters already counted {shared[0]}; "
+                                 "merge only counters of different files.")
+            self.offsets.update(other.offsets)
+            other = other.counts
+        self.counts.update(other)
+
+    def most_common(self, n=10):
+        return self.counts.most_common(n)
+
+    def save(self, path):
+        """Writes a binary snapshot (atomic: readers never see half a file)."""
+        out = bytearray(struct.pack("<4sH", SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+        for table in (self.offsets, self.counts):
+            _write_varint(out, len(table))
+            for key, number in table.items():
+                key = key.encode("utf-8")
+                _write_varint(out, len(key))
+                out += key
+                _write_varint(out, number)
+        with open(path + ".tmp", "wb") as file:
+            file.write(out)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path):
+        """Reads a snapshot written by save()."""
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version = struct.unpack_from("<4sH", data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a WordCounter snapshot.")
+        counter, pos = cls(), struct.calcsize("<4sH")
+        for table in (counter.offsets, counter.counts):
+            size, pos = _read_varint(data, pos)
+            for _ in range(size):
+                length, pos = _read_varint(data, pos)
+                key = data[pos:pos + length].decode("utf-8")
+                table[key], pos = _read_varint(data, pos + length)
+        return counter
+
+with open("corpus.txt", "w") as file:
+    file.write("Hello world\n")
+counter = WordCounter()
+counter.add_file("corpus.txt")
+counter.save("corpus.wcnt")
+
+with open("corpus.txt", "a") as file:     # the corpus grows...
+    file.write("hello python\n")
+counter = WordCounter.load("corpus.wcnt")  # ...next run: load + count only the new line
+counter.add_file("corpus.txt")
+print(counter.most_common(3))
+# Output: [('hello', 2), ('world', 1), ('python', 1)]
+
+# ✅ When to use this logic:
+# - Nightly jobs over append-only logs or corpora.
+# - Workers count their own files, then the results are combined with merge()
+#   (one file split between workers → word_frequency_stream() above instead).
+
+
+# --------------------------------------------------
+# 🔹 11. VOCABULARY – TOKENS AS INTEGER IDS
+# --------------------------------------------------
+# {word: count} costs ~100 bytes per distinct word: a str object (~50+ bytes),
+# a dict slot, and an int object for every count above 256.
+# A vocabulary stores each distinct token ONCE and gives it a dense id:
+#   "hello" → 0, "world" → 1, ...
+# Here every token's UTF-8 bytes go back to back into ONE bytearray (the
+# "arena"), found again through an offsets array; lookups use a small
+# open-addressing hash table of ids. Counts live in a typed array → no
+# per-token Python objects at all, ~45 bytes per distinct token.
+# The price: probing runs in Python → adding is a few times slower than a dict.
+# A tokenized document becomes an array of 4-byte ids → cheap to store and analyze.
+
+import sys
+
+
+class Vocabulary:
+    """Maps tokens to dense integer ids; all tokens share one bytes arena."""
+
+    def __init__(self):
+        self.arena = bytearray()            # every token's UTF-8 bytes, back to back
+        self.offsets = array("Q", [0])      # id → start in arena (id + 1 → end)
+        self.hashes = array("q")            # id → hash(token), checked before the bytes
+        self.counts = array("Q")            # id → count (unsigned 64-bit)
+        self._slots = array("i", [-1]) * 8  # hash table: slot → id (-1 = empty)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def token(self, token_id):
+        """Returns the token with this id."""
+        return self.arena[self.offsets[token_id]:self.offsets[token_id + 1]].decode()
+
+    def _find(self, token, add):
+        """Returns the id of token (adding it when add=True), or -1 if unknown."""
+        h = hash(token)
+        slots, hashes, offsets = self._slots, self.hashes, self.offsets
+        mask = len(slots) - 1
+        i = h & mask
+        data = token.encode()
+        while slots[i] >= 0:                # linear probing until an empty slot
+            token_id = slots[i]
+            if hashes[token_id] == h and self.arena[offsets[token_id]:offsets[token_id + 1]] == data:
+                return token_id
+            i = (i + 1) & mask
+        if not add:
+            return -1
+        token_id = len(self.counts)
+        self.arena += data
+        offsets.append(len(self.arena))
+        hashes.append(h)
+        self.counts.append(0)
+        slots[i] = token_id
+        if 2 * len(self.counts) > len(slots):   # keep the table at most half full
+            self._grow()
+        return token_id
+
+    def _grow(self):
+        slots = array("i", [-1]) * (2 * len(self._slots))
+        mask = len(slots) - 1
+        for token_id, h in enumerate(self.hashes):
+            i = h & mask
+            while slots[i] >= 0:
+                i = (i + 1) & mask
+            slots[i] = token_id
+        self._slots = slots
+
+    def to_ids(self, text, add=True):
+        """Encodes text as an array of ids (-1 for unknown tokens when add=False)."""
+        return array("i", [self._find(token, add) for token in text.lower().split()])
+
+    def add(self, text):
+        """Counts the tokens of text and returns their ids."""
+        encoded = self.to_ids(text)
+        counts = self.counts
+        for token_id in encoded:
+            counts[token_id] += 1
+        return encoded
+
+    def count(self, token):
+        token_id = self._find(token.lower(), add=False)
+        return 0 if token_id < 0 else self.counts[token_id]
+
+    def most_common(self, n=10):
+        best = heapq.nlargest(n, range(len(self.counts)), key=self.counts.__getitem__)
+        return [(self.token(i), self.counts[i]) for i in best]
+
+    def nbytes(self):
+        """Total memory of the vocabulary (arena + arrays)."""
+        return sum(map(sys.getsizeof, (self, self.arena, self.offsets, self.hashes,
+                                       self.counts, self._slots)))
+
+    def counts_array(self):
+        """Returns the counts as a NumPy array (needs numpy installed)."""
+        import numpy as np
+        return np.frombuffer(self.counts, dtype=np.uint64).copy()
+
+vocab = Vocabulary()
+print(vocab.add("Hello hello world"))      # Output: array('i', [0, 0, 1])
+print(vocab.to_ids("world python", add=False))
+# Output: array('i', [1, -1]) → "python" is not in the vocabulary
+print(vocab.most_common(2))                # Output: [('hello', 2), ('world', 1)]
+
+text = " ".join(f"word{i}" for i in range(100_000))
+big_vocab = Vocabulary()
+big_vocab.add(text)
+counts_as_dict = word_frequency(text)
+dict_bytes = sys.getsizeof(counts_as_dict) + sum(map(sys.getsizeof, counts_as_dict))
+print(big_vocab.nbytes(), "bytes vs", dict_bytes, "bytes for the dict + its keys")
+# Output (approx.): 4483572 bytes vs 9633754 bytes for the dict + its keys
+# (counts are all 1 here → shared small ints; real counts add 28 bytes each to the dict)
+
+# ✅ When to use this logic:
+# - NLP pipelines (token ids feed straight into ML models).
+# - Large vocabularies where dict-of-int memory adds up (and speed matters less).
+
+
+# --------------------------------------------------
+# 🔹 12. N-GRAM FREQUENCIES WITH ROLLING HASHES
+# --------------------------------------------------
+# An n-gram = n consecutive items: word bigram "to be", char trigram "pyt".
+# Counting them with tuple/string keys stores a new object for EVERY distinct n-gram.
+# A rolling hash turns each window into one int, reusing the previous one:
+#   hash("to be or") = hash("to be") × BASE + value("or")
+# → every key is one fixed-size int: less memory, and tables can be spilled to
+# disk as flat arrays of (hash, count) and merged back (spill_dir).
+# Text is only rebuilt for the winners we want to print (names()).
+# ⚠️ It is NOT faster: in CPython the hashing arithmetic costs about as much as
+# building the keys (a plain Counter of tuples/strings was ~10% faster here).
+
+import functools
+from operator import itemgetter
+
+NGRAM_MOD = (1 << 61) - 1   # large prime → 61-bit hashes, collisions are very rare
+NGRAM_BASE = 1_000_003
+
+
+@functools.lru_cache(maxsize=1 << 16)       # bounded: a huge vocabulary does not pile up here
+def _word_value(word):
+    """Stable 61-bit value for a word (same in every process)."""
+    digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") % NGRAM_MOD
+
+
+class NGramCounter:
+    """Counts word and character n-grams (n = 1..max_n) keyed on rolling hashes."""
+
+    def __init__(self, max_n=3, min_count=1, max_entries=1_000_000,
+                 spill_dir=None, spill_min_count=1, prune_on_overflow=False):
+        self.max_n = max_n
+        self.min_count = min_count              # n-grams rarer than this are not reported
+        self.max_entries = max_entries          # memory limit before spill / prune
+        self.spill_dir = spill_dir              # set → spill sorted runs to disk (exact counts)
+        self.spill_min_count = spill_min_count  # > 1 → drop rare n-grams from spills (approximate)
+        self.prune_on_overflow = prune_on_overflow  # no spill_dir → forget rare n-grams (approximate)
+        self.discarded = 0                      # n-gram entries dropped so far → counts are approximate
+        self.tables = {(kind, n): Counter()
+                       for kind in ("word", "char") for n in range(1, max_n + 1)}
+        self.runs = {key: [] for key in self.tables}   # sorted run files on disk
+
+    def _feed(self, kind, values):
+        """Updates the rolling hash of every n-gram ending at each value."""
+        tables = [None] + [self.tables[kind, n] for n in range(1, self.max_n + 1)]
+        hashes = [0] * (self.max_n + 1)   # hashes[n] = hash of the last n values
+        for seen, value in enumerate(values):
+            for n in range(min(seen + 1, self.max_n), 0, -1):
+                hashes[n] = (hashes[n - 1] * NGRAM_BASE + value) % NGRAM_MOD
+                tables[n][hashes[n]] += 1
+
+    def add(self, text):
+        """Counts word n-grams of text and character n-grams of each word."""
+        words = text.lower().split()
+        self._feed("word", map(_word_value, words))
+        for word in words:
+            self._feed("char", map(ord, word))
+        if sum(map(len, self.tables.values())) > self.max_entries:
+            if self.spill_dir:
+                self._spill()
+            elif self.prune_on_overflow:
+                self._prune_to_fit()            # lossy: forgets the rarest n-grams
+            # else: keep growing → exact counts, memory is not limited
+
+    @property
+    def approximate(self):
+        """True once any n-gram count was dropped (pruning or spill_min_count)."""
+        return self.discarded > 0
+
+    def prune(self, min_count):
+        """Drops in-memory n-grams seen fewer than min_count times."""
+        for key, table in self.tables.items():
+            kept = Counter({h: c for h, c in table.items() if c >= min_count})
+            self.discarded += len(table) - len(kept)
+            self.tables[key] = kept
+
+    def _prune_to_fit(self):
+        """Raises the count threshold until at most max_entries // 2 n-grams remain."""
+        histogram = Counter(count for table in self.tables.values() for count in table.values())
+        remaining, threshold = sum(histogram.values()), 1
+        for count in sorted(histogram):         # half the cap → the next prune is far away
+            if remaining <= self.max_entries // 2:
+                break
+            remaining -= histogram[count]
+            threshold = count + 1
+        self.prune(threshold)
+
+    def _spill(self):
+        """Writes every table to disk as a sorted run of (hash, count) pairs."""
+        os.makedirs(self.spill_dir, exist_ok=True)
+        for (kind, n), table in self.tables.items():
+            flat = array("Q")
+            for h in sorted(table):
+                if table[h] >= self.spill_min_count:
+                    flat.extend((h, table[h]))
+                else:
+                    self.discarded += 1
+            path = os.path.join(self.spill_dir, f"{kind}{n}-{len(self.runs[kind, n])}.run")
+            with open(path, "wb") as file:
+                flat.tofile(file)
+            self.runs[kind, n].append(path)
+            table.clear()
+
+    @staticmethod
+    def _read_run(path, pairs_per_read=65536):
+        with open(path, "rb") as file:
+            while True:
+                flat = array("Q")
+                flat.frombytes(file.read(16 * pairs_per_read))
+                if not flat:
+                    break
+                yield from zip(flat[::2], flat[1::2])
+
+    def items(self, kind="word", n=1):
+        """Yields (hash, count) for every n-gram with count >= min_count."""
+        table = self.tables[kind, n]
+        if not self.runs[kind, n]:
+            yield from ((h, c) for h, c in table.items() if c >= self.min_count)
+            return
+        streams = [self._read_run(path) for path in self.runs[kind, n]]
+        streams.append((h, table[h]) for h in sorted(table))
+        current, total = None, 0
+        for h, count in heapq.merge(*streams):   # runs are sorted → equal hashes are adjacent
+            if h != current:
+                if current is not None and total >= self.min_count:
+                    yield current, total
+                current, total = h, 0
+            total += count
+        if current is not None and total >= self.min_count:
+            yield current, total
+
+    def top(self, kind="word", n=1, k=10):
+        """Returns the k most frequent [(hash, count), ...]."""
+        return heapq.nlargest(k, self.items(kind, n), key=itemgetter(1))
+
+    def names(self, text, kind, n, hashes):
+        """Rescans text to turn the given hashes back into readable n-grams."""
+        wanted, found = set(hashes), {}
+        words = text.lower().split()
+        for items in ([words] if kind == "word" else words):
+            values = list(map(_word_value, items)) if kind == "word" else list(map(ord, items))
+            for i in range(len(items) - n + 1):
+                h = 0
+                for value in values[i:i + n]:
+                    h = (h * NGRAM_BASE + value) % NGRAM_MOD
+                if h in wanted:
+                    found[h] = (" " if kind == "word" else "").join(items[i:i + n])
+        return found
+
+    def close(self):
+        """Deletes spilled run files."""
+        for paths in self.runs.values():
+            for path in paths:
+                os.remove(path)
+            paths.clear()
+
+text = "to be or not to be"
+ngrams = NGramCounter(max_n=3)
+ngrams.add(text)
+best = ngrams.top("word", 2, k=1)
+names = ngrams.names(text, "word", 2, [h for h, _ in best])
+print([(names[h], count) for h, count in best])   # Output: [('to be', 2)]
+best = ngrams.top("char", 2, k=1)
+names = ngrams.names(text, "char", 2, [h for h, _ in best])
+print([(names[h], count) for h, count in best])   # Output: [('to', 2)]
+
+# Big corpus → spill sorted runs to disk instead of holding everything in RAM:
+# ngrams = NGramCounter(max_n=5, min_count=3, spill_dir="ngram_runs")
+# No disk? prune_on_overflow=True keeps memory under max_entries by forgetting the
+# rarest n-grams → counts become approximate (check ngrams.approximate / .discarded).
+
+# ✅ When to use this logic:
+# - Feature extraction (bag of n-grams), autocomplete, language detection.
+# - Pair it with top() + names() so only the winners ever become strings.
+# - Corpus fits in RAM and speed matters more? Counter(zip(words, words[1:])) is simpler.
+
+
 # --------------------------------------------------
 # ✅ SUMMARY (REVISION QUICK NOTES)
 # --------------------------------------------------
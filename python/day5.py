@@ -48,6 +48,68 @@ print("Cleaned Text:", cleaned_text)
 # Output: Cleaned Text: hello world welcome to python programming
 
 
+# ==============================================
+# 🔹 Batch Text Cleaning (Compiled TextCleaner)
+# ==============================================
+# clean_text() is fine for one string, but for millions of rows the cost of
+# each call (pattern lookup, three passes, function overhead) adds up.
+# TextCleaner compiles its pattern once and cleans a whole batch of rows with
+# ONE regex pass and ONE lower() pass over a joined buffer.
+# Output is exactly the same as clean_text().
+
+class TextCleaner:
+    """Reusable, precompiled version of clean_text() with batch APIs."""
+
+    SEPARATOR = "\x00"  # joins rows in a batch; kept by the pattern below
+
+    def __init__(self, batch_size=10_000):
+        self.batch_size = batch_size
+        self._punct = re.compile(r"[^\w\s\x00]")  # same as clean_text, but keeps the separator
+
+    def clean(self, text):
+        """Cleans a single string (same result as clean_text)."""
+        return self.clean_many([text])[0]
+
+    def clean_many(self, texts):
+        """Cleans an iterable of strings and returns a list."""
+        cleaned = []
+        batch = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) >= self.batch_size:
+                cleaned.extend(self._clean_batch(batch))
+                batch = []
+        if batch:
+            cleaned.extend(self._clean_batch(batch))
+        return cleaned
+
+    def clean_stream(self, file):
+        """Yields one cleaned line at a time from an open text file."""
+        while True:
+            lines = file.readlines(self.batch_size * 80)  # ~batch_size lines per read
+            if not lines:
+                break
+            yield from self._clean_batch(lines)
+
+    def _clean_batch(self, batch):
+        """Cleans a list of strings in one pass over the joined text."""
+        joined = self.SEPARATOR.join(batch)
+        if joined.count(self.SEPARATOR) != len(batch) - 1:
+            # A row contains the separator itself → fall back to row by row
+            return [" ".join(self._punct.sub("", text).replace(self.SEPARATOR, "").split()).lower()
+                    for text in batch]
+        joined = self._punct.sub("", joined).lower()   # strip punctuation + case fold
+        return [" ".join(row.split()) for row in joined.split(self.SEPARATOR)]
+
+cleaner = TextCleaner()
+print(cleaner.clean_many(["  Hello, World!! ", "Welcome to   PYTHON..."]))
+# Output: ['hello world', 'welcome to python']
+
+# ✅ When to use:
+# - Cleaning big CSV columns, log lines or NLP datasets in bulk.
+# - Create the cleaner once and reuse it (compiling is the expensive part).
+
+
 # ==============================================
 # 🔹 Palindrome Checker (Logic Practice)
 # ==============================================
@@ -67,6 +129,88 @@ else:
 # Output: "Madam" is a palindrome.
 
 
+# ==============================================
+# 🔹 Faster Palindromes (Two Pointers + Manacher)
+# ==============================================
+# is_palindrome() builds a filtered copy AND a reversed copy of the text.
+# Two pointers walk inward from both ends instead, skipping symbols in place,
+# and stop at the first mismatch → no copies, early exit.
+
+def is_palindrome_fast(text):
+    """Two-pointer palindrome check (ignores case and non-alphanumerics)."""
+    left, right = 0, len(text) - 1
+    while left < right:
+        if not text[left].isalnum():
+            left += 1
+        elif not text[right].isalnum():
+            right -= 1
+        elif text[left].lower() != text[right].lower():
+            return False
+        else:
+            left += 1
+            right -= 1
+    return True
+
+def are_palindromes(candidates):
+    """Batch version: checks many strings and returns a list of booleans."""
+    return list(map(is_palindrome_fast, candidates))
+
+print(are_palindromes(["Madam", "A man, a plan, a canal: Panama", "Python"]))
+# Output: [True, True, False]
+
+
+# Checking every substring for palindromes is O(n²) or worse.
+# Manacher's algorithm reuses the "mirror" of palindromes already found,
+# so it gets the palindrome radius around every center in O(n).
+
+def _palindrome_radii(text):
+    """Returns (odd, even) radii of the longest palindrome at each center."""
+    n = len(text)
+    odd = [0] * n    # odd[i]  → palindrome text[i-k+1 : i+k] has length 2k-1
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and text[i - k] == text[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    even = [0] * n   # even[i] → palindrome text[i-k : i+k] has length 2k
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and text[i - k - 1] == text[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+    return odd, even
+
+def longest_palindrome(text):
+    """Finds the longest palindromic substring in O(n) (Manacher)."""
+    odd, even = _palindrome_radii(text)
+    start, length = 0, 0
+    for i in range(len(text)):
+        if 2 * odd[i] - 1 > length:
+            start, length = i - odd[i] + 1, 2 * odd[i] - 1
+        if 2 * even[i] > length:
+            start, length = i - even[i], 2 * even[i]
+    return text[start:start + length]
+
+def count_palindromes(text):
+    """Counts all palindromic substrings (by position) in O(n)."""
+    odd, even = _palindrome_radii(text)
+    return sum(odd) + sum(even)
+
+print(longest_palindrome("forgeeksskeegfor"))  # Output: geeksskeeg
+print(count_palindromes("aaa"))                # Output: 6 → a, a, a, aa, aa, aaa
+
+# ✅ When to use:
+# - Two pointers → validating many short strings (usernames, codes, etc.).
+# - Manacher → longest / all palindromes in large texts (DNA, logs, interview classic).
+
+
 # ==============================================
 # 🔹 Introduction to Regex (Regular Expressions)
 # ==============================================
@@ -94,6 +238,64 @@ print(updated_text)
 # Output: Contact me at XXX-XXX-XXXX or XXXXXXXXXX
 
 
+# ==============================================
+# 🔹 Regex on Huge Files (mmap + Precompiled Bytes Patterns)
+# ==============================================
+# findall()/sub() above need the whole text in memory as a str.
+# mmap maps a file into memory WITHOUT reading it: the OS loads pages only
+# when the regex touches them. `re` can search an mmap directly (bytes
+# patterns), so the file is scanned as one buffer → a match can never be
+# cut in half at a chunk boundary.
+
+import mmap
+import os
+
+PHONE_PATTERN = re.compile(rb"(?<!\d)\d{3}[-. ]?\d{3}[-. ]?\d{4}(?!\d)")
+DIGIT_PATTERN = re.compile(rb"\d")
+
+def iter_matches(path, pattern=PHONE_PATTERN):
+    """Lazily yields (offset, matched_bytes) for every match in a file."""
+    if os.path.getsize(path) == 0:      # an empty file cannot be mmap-ed
+        return
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for match in pattern.finditer(data):
+                yield match.start(), match.group()
+
+def mask_file(src, dst, pattern=PHONE_PATTERN, mask=b"X"):
+    """Copies src to dst with every digit inside a match replaced by `mask`."""
+    masked = 0
+    tmp = dst + ".tmp"                  # dst appears only when complete → src == dst is safe too
+    try:
+        with open(tmp, "wb") as out:
+            if os.path.getsize(src) > 0:
+                with open(src, "rb") as file:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        with memoryview(data) as view:      # slices of a view are not copies
+                            last = 0
+                            for match in pattern.finditer(data):
+                                out.write(view[last:match.start()])
+                                out.write(DIGIT_PATTERN.sub(mask, match.group()))
+                                last = match.end()
+                                masked += 1
+                            out.write(view[last:])
+        os.replace(tmp, dst)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return masked
+
+with open("calls.log", "w") as file:
+    file.write("user=1 phone=123-456-7890\nuser=2 phone=9876543210 id=42\n")
+
+print(list(iter_matches("calls.log")))
+# Output: [(13, b'123-456-7890'), (39, b'9876543210')]
+
+print(mask_file("calls.log", "calls_masked.log"), "numbers masked")
+# Output: 2 numbers masked  → calls_masked.log has phone=XXX-XXX-XXXX, phone=XXXXXXXXXX
+
+
 # ==============================================
 # 🔹 Practical Tips
 # ==============================================
@@ -102,4 +304,5 @@ print(updated_text)
 # ✅ Use regex for searching, validating (emails, phone numbers, etc.).
 # ✅ Practice writing regex patterns by testing on small examples.
 # ✅ Reuse helper functions like clean_text() in projects (data cleaning, NLP, etc.).
+# ✅ Compile patterns once (re.compile) and use mmap + bytes patterns for huge files.
 
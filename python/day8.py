@@ -177,18 +177,1180 @@ print(f"{name} is awesome!")
 
 
 # ------------------------------------------------------------
-# 🧠 7. INTERVIEW QUICK RECAP
+# 🔹 7. ASYNC FILE I/O – DON'T BLOCK THE EVENT LOOP
+# ------------------------------------------------------------
+# open()/read() are BLOCKING: while one coroutine reads a big file, the
+# whole event loop (every other task) is frozen.
+# asyncio.to_thread() runs the blocking call in a worker thread and lets
+# the loop keep serving other tasks until the result is ready.
+# A Semaphore limits how many files are open at the same time.
+
+import threading
+
+_append_locks = {}   # path → lock, so concurrent appends never interleave
+
+
+def _read_file(path, encoding):
+    with open(path, "r", encoding=encoding) as file:
+        return file.read()
+
+
+def _append_file(path, text, encoding):
+    with _append_locks.setdefault(path, threading.Lock()):
+        with open(path, "a", encoding=encoding) as file:
+            file.write(text if text.endswith("\n") else text + "\n")
+
+
+def _count_words_and_lines(path, encoding):
+    """Same result as day 6's count_words_and_lines(), one line at a time."""
+    lines = words = 0
+    try:
+        with open(path, "r", encoding=encoding) as file:
+            for line in file:
+                lines += 1
+                words += len(line.split())
+    except FileNotFoundError:
+        print("⚠️ File not found!")
+    return lines, words
+
+
+async def read_file_async(path, encoding="utf-8"):
+    return await asyncio.to_thread(_read_file, path, encoding)
+
+async def append_file_async(path, text, encoding="utf-8"):
+    await asyncio.to_thread(_append_file, path, text, encoding)
+
+async def count_words_and_lines_async(path, encoding="utf-8"):
+    return await asyncio.to_thread(_count_words_and_lines, path, encoding)
+
+async def count_many_async(paths, limit=8, encoding="utf-8"):
+    """Counts many files concurrently, at most `limit` at a time → {path: (lines, words)}."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def count_one(path):
+        async with semaphore:
+            return path, await count_words_and_lines_async(path, encoding)
+
+    return dict(await asyncio.gather(*(count_one(path) for path in paths)))
+
+async def file_demo():
+    for n in range(3):
+        with open(f"async_{n}.txt", "w") as file:
+            file.write("hello async world\n")
+    await asyncio.gather(*(append_file_async("async_0.txt", f"line {i}") for i in range(3)))
+    print(await read_file_async("async_1.txt"), end="")
+    print(await count_many_async([f"async_{n}.txt" for n in range(3)], limit=2))
+
+asyncio.run(file_demo())
+# Output:
+# hello async world
+# {'async_0.txt': (4, 9), 'async_1.txt': (1, 3), 'async_2.txt': (1, 3)}
+
+# ✅ When to use:
+# - Async web services (FastAPI, aiohttp) that also read/write files.
+# - Never call plain open()/read() on large files inside `async def`.
+
+
+# ------------------------------------------------------------
+# 🔹 8. LOW-OVERHEAD LOGGING DECORATOR (for hot functions)
+# ------------------------------------------------------------
+# logger() above builds an f-string with repr() of every argument and calls
+# print() twice on EVERY call → far too slow for a function called 1M times.
+# log_calls():
+# - skips all work when the level is disabled (logger.isEnabledFor),
+# - samples: only every Nth call is logged, N = round(1 / sample)
+#   (sample=0.01 → 1 call in 100, 0.4 → 1 in 2, anything above 2/3 → every call),
+# - formats LAZILY: the call only puts a tuple on a queue.SimpleQueue
+#   (C-level, no lock to take); a background thread builds the message
+#   (even repr() of the result) and survives a broken __repr__ or handler,
+# - never blocks or grows without limit: when the thread falls behind and the
+#   queue is full, the record is dropped and counted in stats()["dropped"],
+# - measures its own overhead (timing + enqueue) per logged call.
+# Note: arguments are formatted later → log values, not objects you mutate.
+
+import functools
+import itertools
+import logging
+import queue
+import sys
+import time
+import traceback
+from collections import deque
+
+_LOG_QUEUE_SIZE = 10_000                            # records waiting to be formatted (± one per thread)
+_log_records = queue.SimpleQueue()                  # Queue(maxsize) would cost ~1 µs per put
+_log_thread = None
+_dropped_lock = threading.Lock()                    # "dropped" is written by callers and the thread
+
+
+def _count_dropped(stats):
+    with _dropped_lock:
+        stats["dropped"] += 1
+
+
+def _safe_repr(value):
+    try:
+        return repr(value)
+    except Exception:                               # a broken __repr__ must not stop logging
+        return object.__repr__(value)
+
+
+def _log_worker():
+    """Turns queued calls into LogRecords (the only place anything is formatted)."""
+    while True:
+        item = _log_records.get()
+        if isinstance(item, threading.Event):       # flush_logs() marker
+            item.set()
+            continue
+        logger, level, name, args, kwargs, kind, outcome, duration_ns, when, thread, stats = item
+        try:
+            call = ", ".join([*map(_safe_repr, args),
+                              *(f"{key}={_safe_repr(value)}" for key, value in kwargs.items())])
+            text = {"raised": f"raised {_safe_repr(outcome)}", "result": _safe_repr(outcome)}.get(kind, "done")
+            record = logger.makeRecord(
+                logger.name, level, "(log_calls)", 0, "%s(%s) → %s in %.1f µs",
+                (name, call, text, duration_ns / 1000), None,
+                extra={"function": name, "duration_ns": duration_ns})
+            record.created, record.msecs, record.thread = when, (when % 1) * 1000, thread
+            logger.handle(record)
+            stats["logged"] += 1                    # single writer → no lock needed
+        except Exception:                           # same as logging.Handler.handleError
+            _count_dropped(stats)
+            if logging.raiseExceptions:
+                sys.stderr.write(f"--- log_calls: record for {name} dropped ---\n")
+                traceback.print_exc(file=sys.stderr)
+
+
+def flush_logs():
+    """Blocks until every record queued so far has been handed to the handlers."""
+    if _log_thread is not None:
+        done = threading.Event()
+        _log_records.put(done)
+        done.wait()
+
+
+def log_calls(logger=None, level=logging.INFO, sample=1.0, log_result=True):
+    """Decorator factory: logs 1 call in round(1 / sample) of a function in the background."""
+    if not 0 < sample <= 1:
+        raise ValueError(f"sample must be in (0, 1], got {sample!r}")
+    global _log_thread
+    if _log_thread is None:
+        _log_thread = threading.Thread(target=_log_worker, name="log_calls", daemon=True)
+        _log_thread.start()
+    every = max(1, round(1 / sample))
+
+    def decorator(func):
+        log = logger or logging.getLogger(func.__module__)
+        name = func.__qualname__
+        calls = itertools.count()                   # next() is atomic → thread-safe
+        overhead = deque(maxlen=1024)               # ns per logged call; append is atomic
+        stats = {"logged": 0, "dropped": 0}
+
+        def enqueue(*record):
+            if _log_records.qsize() < _LOG_QUEUE_SIZE:
+                _log_records.put(record + (stats,))
+            else:                                   # thread behind → drop, never block the caller
+                _count_dropped(stats)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if next(calls) % every or not log.isEnabledFor(level):
+                return func(*args, **kwargs)        # fast path: one counter + one check
+            start = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as error:
+                end = time.perf_counter_ns()
+                enqueue(log, max(level, logging.ERROR), name, args, kwargs,
+                        "raised", error, end - start, time.time(), threading.get_ident())
+                raise
+            end = time.perf_counter_ns()
+            enqueue(log, level, name, args, kwargs,
+                    "result" if log_result else "done", result if log_result else None,
+                    end - start, time.time(), threading.get_ident())
+            overhead.append(time.perf_counter_ns() - end)
+            return result
+
+        def call_stats():
+            samples = list(overhead)
+            return {"sample_every": every, "logged": stats["logged"], "dropped": stats["dropped"],
+                    "overhead_ns_avg": sum(samples) // len(samples) if samples else 0,
+                    "overhead_ns_max": max(samples, default=0)}
+
+        wrapper.stats = call_stats
+        return wrapper
+    return decorator
+
+call_log = logging.getLogger("day8.calls")
+call_log.addHandler(logging.StreamHandler(sys.stdout))
+call_log.setLevel(logging.INFO)
+call_log.propagate = False
+
+@log_calls(call_log, sample=0.25)                   # log 1 call in 4
+def multiply(a, b):
+    return a * b
+
+for i in range(8):
+    multiply(i, 10)
+flush_logs()
+# Output:
+# multiply(0, 10) → 0 in 0.4 µs
+# multiply(4, 10) → 40 in 0.3 µs
+print(multiply.stats())
+# Output: {'sample_every': 4, 'logged': 2, 'dropped': 0, 'overhead_ns_avg': 1500, 'overhead_ns_max': 2100}
+# (timings vary by machine; skipped calls cost one counter + one check)
+
+# ✅ When to use:
+# - Tracing calls of hot functions in production without slowing them down.
+# - Raise sample (1.0 = every call) while debugging, lower it under load.
+
+
+# ------------------------------------------------------------
+# 🔹 9. @timed – LATENCY HISTOGRAMS & PERCENTILES
+# ------------------------------------------------------------
+# "Average time" hides the slow calls. What we want is p50 / p90 / p99 / max.
+# Storing every duration would grow forever, so LatencyHistogram uses
+# log buckets (like HdrHistogram):
+# - durations below 2 × 64 ns are counted exactly,
+# - above that, every power of two is split into 64 sub-buckets
+#   → each value is off by at most 1/64 (≈1.6%), from 1 ns up to ~4.9 hours,
+# - fixed memory: 2,496 counters (~20 KB) per function, whatever the traffic.
+# Every thread records into its OWN histogram (no locks on the hot path);
+# when a thread ends, its histogram is folded into one shared "finished" one
+# → memory stays fixed even with a thread per request. Snapshots merge them,
+# and JSON exports can be merged across processes.
+
+import json
+import os
+import weakref
+from array import array
+from itertools import accumulate
+
+
+class LatencyHistogram:
+    """Fixed-size log-bucketed histogram of durations in nanoseconds."""
+
+    def __init__(self, sub_bits=6, max_bits=44):
+        self.sub_bits, self.max_bits = sub_bits, max_bits
+        self.counts = array("Q", bytes(8 * ((max_bits - sub_bits + 1) << sub_bits)))
+        self.total = self.max = 0
+        self._last = len(self.counts) - 1
+
+    def record(self, value):
+        """Adds one duration; kept to a few integer ops (runs on every call)."""
+        shift = value.bit_length() - self.sub_bits - 1
+        index = value if shift <= 0 else (shift << self.sub_bits) + (value >> shift)
+        self.counts[index if index < self._last else self._last] += 1   # huge → last bucket
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def _highest(self, index):
+        """Largest value that lands in bucket `index`."""
+        if index < 2 << self.sub_bits:
+            return index
+        shift = (index >> self.sub_bits) - 1
+        return ((index - (shift << self.sub_bits) + 1) << shift) - 1
+
+    def percentiles(self, *points):
+        """percentiles(50, 99) → [p50, p99] in ns (within ~1.6%, never above max)."""
+        count = self.count
+        if not count:
+            return [0] * len(points)
+        running = accumulate(self.counts)
+        found, index, seen = {}, -1, 0
+        for point in sorted(set(points)):                 # one pass over the buckets
+            rank = max(1, -(-point * count // 100))       # ceil(point% of count)
+            while seen < rank:
+                seen = next(running)
+                index += 1
+            found[point] = self.max if index == self._last else min(self._highest(index), self.max)
+        return [found[point] for point in points]
+
+    def merge(self, other):
+        """Adds another histogram's counts (same layout) into this one."""
+        if (other.sub_bits, other.max_bits) != (self.sub_bits, self.max_bits):
+            raise ValueError("Histograms with different bucket layouts cannot be merged.")
+        self.counts = array("Q", map(int.__add__, self.counts, other.counts))
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        return self
+
+    def summary(self):
+        count = self.count
+        p50, p90, p99 = self.percentiles(50, 90, 99)
+        return {"count": count, "mean_ns": self.total // count if count else 0,
+                "p50_ns": p50, "p90_ns": p90, "p99_ns": p99, "max_ns": self.max}
+
+    def to_dict(self):
+        """JSON-friendly form; only non-empty buckets are kept."""
+        return {"sub_bits": self.sub_bits, "max_bits": self.max_bits,
+                "total": self.total, "max": self.max,
+                "buckets": {index: n for index, n in enumerate(self.counts) if n}}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data["sub_bits"], data["max_bits"])
+        for index, n in data["buckets"].items():
+            histogram.counts[int(index)] = n
+        histogram.total, histogram.max = data["total"], data["max"]
+        return histogram
+
+
+class _FunctionTimings:
+    """Histograms of one function: one per live thread + one for finished threads."""
+
+    def __init__(self):
+        self.live = []
+        self.finished = LatencyHistogram()
+        self.lock = threading.Lock()                # taken only when threads end / on snapshots
+
+    def retire(self, histogram):
+        with self.lock:
+            self.finished.merge(histogram)
+            self.live.remove(histogram)
+
+
+class _ThreadToken:
+    """Lives in a thread-local → garbage once its thread has ended."""
+
+
+_timings = {}   # function name → _FunctionTimings
+
+
+def timed(func=None, *, name=None):
+    """Decorator: records the duration of every call (perf_counter_ns) per function."""
+    if func is None:                                # used as @timed(name="...")
+        return lambda func: timed(func, name=name)
+    label = name or f"{func.__module__}.{func.__qualname__}"
+    timings = _timings.setdefault(label, _FunctionTimings())
+    local = threading.local()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            try:
+                histogram = local.histogram
+            except AttributeError:                  # first call from this thread
+                histogram = local.histogram = LatencyHistogram()
+                with timings.lock:
+                    timings.live.append(histogram)
+                token = local.token = _ThreadToken()
+                weakref.finalize(token, timings.retire, histogram).atexit = False
+            histogram.record(elapsed)
+
+    return wrapper
+
+
+def timing_snapshot():
+    """{function name: LatencyHistogram} with all threads merged."""
+    snapshot = {}
+    for label, timings in list(_timings.items()):
+        merged = LatencyHistogram()
+        with timings.lock:
+            for histogram in [timings.finished, *timings.live]:
+                merged.merge(histogram)
+        snapshot[label] = merged
+    return snapshot
+
+
+def _prometheus_label(label):
+    return label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus_text(snapshot):
+    lines = ["# TYPE python_call_duration_seconds summary"]
+    for label, histogram in sorted(snapshot.items()):
+        tag = _prometheus_label(label)
+        for point, value in zip(("0.5", "0.9", "0.99"), histogram.percentiles(50, 90, 99)):
+            lines.append(f'python_call_duration_seconds{{function="{tag}",quantile="{point}"}} {value / 1e9:.9f}')
+        lines.append(f'python_call_duration_seconds_sum{{function="{tag}"}} {histogram.total / 1e9:.9f}')
+        lines.append(f'python_call_duration_seconds_count{{function="{tag}"}} {histogram.count}')
+    lines.append("# TYPE python_call_duration_max_seconds gauge")
+    for label, histogram in sorted(snapshot.items()):
+        lines.append(f'python_call_duration_max_seconds{{function="{_prometheus_label(label)}"}} {histogram.max / 1e9:.9f}')
+    return "\n".join(lines) + "\n"
+
+
+def export_timings(path, fmt="json"):
+    """Writes a snapshot to `path` as "json" (mergeable) or "prometheus" text."""
+    snapshot = timing_snapshot()
+    if fmt == "json":
+        text = json.dumps({label: {**h.summary(), "histogram": h.to_dict()}
+                           for label, h in snapshot.items()}, indent=1)
+    elif fmt == "prometheus":
+        text = _prometheus_text(snapshot)
+    else:
+        raise ValueError("fmt must be 'json' or 'prometheus'.")
+    with open(path + ".tmp", "w", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(path + ".tmp", path)   # readers never see a half-written file
+
+
+def load_timings(*paths):
+    """Merges JSON exports (e.g. one per worker process) → {name: LatencyHistogram}."""
+    merged = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for label, data in json.load(file).items():
+                histogram = LatencyHistogram.from_dict(data["histogram"])
+                if label in merged:
+                    merged[label].merge(histogram)
+                else:
+                    merged[label] = histogram
+    return merged
+
+@timed
+def sum_of_squares(n):
+    return sum(x * x for x in range(n))
+
+for n in range(2000):
+    sum_of_squares(n % 100)
+workers = [threading.Thread(target=sum_of_squares, args=(10_000,)) for _ in range(2)]
+for worker in workers:
+    worker.start()
+for worker in workers:
+    worker.join()
+
+for label, histogram in timing_snapshot().items():
+    print("⏱️", label, histogram.summary())
+# Output: ⏱️ __main__.sum_of_squares {'count': 2002, 'mean_ns': 3672, 'p50_ns': 2943,
+#                                      'p90_ns': 4863, 'p99_ns': 7295, 'max_ns': 664024}
+export_timings("timings.json")               # merge per-process files with load_timings()
+export_timings("timings.prom", "prometheus")
+# timings.prom:
+# python_call_duration_seconds{function="__main__.sum_of_squares",quantile="0.99"} 0.000007295
+
+# ✅ When to use:
+# - Finding slow calls in production (tail latency, not just the average).
+# - Export JSON per process → merge; Prometheus text → node_exporter textfile collector.
+
+
+# ------------------------------------------------------------
+# 🔹 10. MEMOIZATION – CACHE RESULTS (LRU, TTL, BYTE BUDGET)
+# ------------------------------------------------------------
+# A pure function called again with the same arguments can return the
+# saved result instead of recomputing it. memoize() adds what a plain dict
+# (or functools.lru_cache) is missing:
+# - LRU: the least-recently-used entry is dropped first,
+# - ttl: entries expire after `ttl` seconds (data that goes stale),
+# - max_bytes: the budget is in BYTES (rough deep size of each result),
+#   so 1000 tiny results and 3 huge ones are treated differently,
+# - hits / misses / evictions counters, optional lock for threads,
+# - async functions: concurrent calls with the same arguments share ONE
+#   in-flight call instead of all hitting the slow API.
+
+import contextlib
+import inspect
+import types
+from collections import OrderedDict
+
+_MISSING = object()
+_KW_MARK = object()   # separates args from kwargs in cache keys (like functools)
+
+
+def _approx_size(obj, limit=10_000):
+    """Rough deep size in bytes: the object + containers, __dict__ and __slots__ inside it."""
+    seen, stack, total = set(), [obj], 0
+    while stack and len(seen) < limit:              # limit → big objects stay cheap to measure
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+        elif not isinstance(item, (str, bytes, int, float, type, types.ModuleType)) and not callable(item):
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for cls in type(item).__mro__:
+                slots = getattr(cls, "__slots__", ())
+                for slot in (slots,) if isinstance(slots, str) else slots:
+                    value = getattr(item, slot, _MISSING)
+                    if value is not _MISSING:
+                        stack.append(value)
+    return total
+
+
+def memoize(max_entries=None, ttl=None, max_bytes=None, lock=False, sizeof=_approx_size):
+    """Decorator factory: caches results by arguments (sync or async functions)."""
+
+    def decorator(func):
+        cache = OrderedDict()                       # key → (value, expires_at, size); oldest first
+        expiry = deque()                            # ttl only: (expires_at, key) in store order
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "deduped": 0, "bytes": 0}
+        guard = threading.Lock() if lock else contextlib.nullcontext()
+        in_flight = {}                              # async only: key → running Task
+
+        def make_key(args, kwargs):
+            return args + (_KW_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+
+        def lookup(key):
+            with guard:
+                entry = cache.get(key, _MISSING)
+                if entry is not _MISSING:
+                    value, expires_at, size = entry
+                    if expires_at is None or time.monotonic() < expires_at:
+                        cache.move_to_end(key)      # most recently used → end
+                        stats["hits"] += 1
+                        return value
+                    del cache[key]
+                    stats["bytes"] -= size
+                    stats["expired"] += 1
+                stats["misses"] += 1
+                return _MISSING
+
+        def store(key, value):
+            size = sizeof((key, value)) if max_bytes else 0
+            if max_bytes and size > max_bytes:
+                return                              # would evict everything and still not fit
+            expires_at = time.monotonic() + ttl if ttl else None
+            with guard:
+                if ttl:                             # same ttl for all → store order = expiry order
+                    now = time.monotonic()
+                    while expiry and expiry[0][0] <= now:
+                        old_expires_at, old_key = expiry.popleft()
+                        old = cache.get(old_key)
+                        if old is not None and old[1] == old_expires_at:   # not stored again since
+                            del cache[old_key]
+                            stats["bytes"] -= old[2]
+                            stats["expired"] += 1
+                    expiry.append((expires_at, key))
+                old = cache.pop(key, None)
+                if old is not None:
+                    stats["bytes"] -= old[2]
+                cache[key] = (value, expires_at, size)
+                stats["bytes"] += size
+                while ((max_entries and len(cache) > max_entries)
+                       or (max_bytes and stats["bytes"] > max_bytes)):
+                    _, (_, _, old_size) = cache.popitem(last=False)   # least recently used
+                    stats["bytes"] -= old_size
+                    stats["evictions"] += 1
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                value = lookup(key)
+                if value is not _MISSING:
+                    return value
+                task = in_flight.get(key)
+                if task is None:
+                    task = in_flight[key] = asyncio.ensure_future(func(*args, **kwargs))
+                    task.add_done_callback(lambda _: in_flight.pop(key, None))
+                else:
+                    stats["deduped"] += 1
+                value = await asyncio.shield(task)  # one caller cancelled ≠ call cancelled
+                store(key, value)                   # errors are raised above, never cached
+                return value
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                value = lookup(key)
+                if value is _MISSING:
+                    value = func(*args, **kwargs)   # computed outside the lock
+                    store(key, value)
+                return value
+
+        def cache_info():
+            with guard:
+                return {**stats, "entries": len(cache)}
+
+        def cache_clear():
+            with guard:
+                cache.clear()
+                expiry.clear()
+                stats["bytes"] = 0
+
+        wrapper.cache_info, wrapper.cache_clear = cache_info, cache_clear
+        return wrapper
+    return decorator
+
+@memoize(max_entries=128)
+def factorial(n):
+    return 1 if n < 2 else n * factorial(n - 1)
+
+factorial(30)
+factorial(31)                                   # only 31 is new, factorial(30) is a hit
+print(factorial.cache_info())
+# Output: {'hits': 1, 'misses': 31, 'evictions': 0, 'expired': 0, 'deduped': 0, 'bytes': 0, 'entries': 31}
+
+@memoize(max_bytes=200_000, lock=True)          # budget in bytes, safe to share across threads
+def squares_upto(n):
+    return [x * x for x in range(n)]
+
+for n in (1000, 2000, 1000, 3000):
+    squares_upto(n)
+print(squares_upto.cache_info())
+# Output: {'hits': 1, 'misses': 3, 'evictions': 1, 'expired': 0, 'deduped': 0, 'bytes': 147160, 'entries': 2}
+# → adding 3000 evicted 2000 (least recently used), not the 1000 that was just reused
+
+@memoize(ttl=60)
+async def fetch_user(user_id):
+    await asyncio.sleep(0.1)                    # slow API call
+    return {"id": user_id}
+
+async def cache_demo():
+    await asyncio.gather(*(fetch_user(1) for _ in range(5)))   # 5 callers, ONE API call
+    await fetch_user(1)
+
+asyncio.run(cache_demo())
+print(fetch_user.cache_info())
+# Output: {'hits': 1, 'misses': 5, 'evictions': 0, 'expired': 0, 'deduped': 4, 'bytes': 0, 'entries': 1}
+
+# ✅ When to use:
+# - Pure, expensive functions called repeatedly with the same arguments.
+# - ttl for data that changes (prices, API responses); max_bytes for big results.
+
+
+# ------------------------------------------------------------
+# 🔹 11. HOT-PATH TRACER – WHICH FUNCTIONS ARE REALLY SLOW?
+# ------------------------------------------------------------
+# dis.dis() shows what a function compiles to, not where a running program
+# spends its time. cProfile answers that but slows everything down a lot.
+# HotPathTracer records, per function:
+# - calls, inclusive time (with callees), exclusive time (own code only),
+# - collapsed stacks ("main;load;parse 1234") → input for flamegraph tools.
+# Python 3.12+ → sys.monitoring (PEP 669): start()/stop() switch the events
+# on and off at runtime, and while stopped the cost is ZERO.
+# Older Pythons → sys.setprofile() fallback (current + new threads only,
+# and every generator resume counts as a call). stop() unhooks this thread;
+# threads started while tracing unhook themselves on their next event.
+# Each thread keeps its own stack and totals → no locks in the callbacks.
+
+
+class _TracerThread:
+    """Per-thread state: open frames, per-code totals and the call tree."""
+
+    def __init__(self):
+        self.stack = []     # [code, start_ns, child_ns, node, counted] per open frame
+        self.stats = {}     # code → [calls, inclusive_ns, exclusive_ns]
+        self.active = {}    # code → open frames of it (inclusive time counted once if recursive)
+        self.nodes = {}     # (parent node, code) → node id; node 0 = thread root
+        self.self_ns = []   # node id → exclusive ns spent at exactly this stack
+
+
+class HotPathTracer:
+    """Low-overhead function profiler that can be started and stopped at runtime."""
+
+    def __init__(self):
+        self.running = False
+        self._local = threading.local()
+        self._threads = []                          # every _TracerThread ever created
+        self._monitoring = getattr(sys, "monitoring", None)
+
+    def _state(self):
+        try:
+            return self._local.state
+        except AttributeError:
+            state = self._local.state = _TracerThread()
+            self._threads.append(state)
+            return state
+
+    def _enter(self, code, counted=True):
+        now = time.perf_counter_ns()
+        state = self._state()
+        parent = state.stack[-1][3] if state.stack else 0
+        node = state.nodes.get((parent, code))
+        if node is None:
+            node = state.nodes[parent, code] = len(state.self_ns) + 1
+            state.self_ns.append(0)
+        state.stack.append([code, now, 0, node, counted])
+        state.active[code] = state.active.get(code, 0) + 1
+
+    def _exit(self, code):
+        now = time.perf_counter_ns()
+        state = self._state()
+        if not state.stack or state.stack[-1][0] is not code:
+            return                                  # frame was entered before start()
+        _, start, child_ns, node, counted = state.stack.pop()
+        elapsed = now - start
+        stats = state.stats.get(code)
+        if stats is None:
+            stats = state.stats[code] = [0, 0, 0]
+        stats[0] += counted                         # counted on exit → open frames never show up
+        state.active[code] -= 1
+        if not state.active[code]:
+            stats[1] += elapsed                     # outermost frame of a recursion only
+        stats[2] += elapsed - child_ns
+        state.self_ns[node - 1] += elapsed - child_ns
+        if state.stack:
+            state.stack[-1][2] += elapsed
+
+    # sys.monitoring callbacks (3.12+)
+    def _on_start(self, code, offset):
+        self._enter(code)
+
+    def _on_resume(self, code, offset, exception=None):
+        self._enter(code, counted=False)            # generator / coroutine resumed
+
+    def _on_exit(self, code, offset, value):
+        self._exit(code)                            # return, yield or exception
+
+    # sys.setprofile callback (fallback)
+    def _on_profile(self, frame, event, arg):
+        if not self.running:
+            sys.setprofile(None)                    # thread started while tracing → unhook it
+            return
+        if event == "call":
+            self._enter(frame.f_code)
+        elif event == "return":
+            self._exit(frame.f_code)
+
+    def start(self):
+        if self.running:
+            return self
+        monitoring = self._monitoring
+        if monitoring is not None:
+            tool, events = monitoring.PROFILER_ID, monitoring.events
+            monitoring.use_tool_id(tool, "HotPathTracer")    # ValueError if already in use
+            monitoring.register_callback(tool, events.PY_START, self._on_start)
+            for event in (events.PY_RESUME, events.PY_THROW):
+                monitoring.register_callback(tool, event, self._on_resume)
+            for event in (events.PY_RETURN, events.PY_YIELD, events.PY_UNWIND):
+                monitoring.register_callback(tool, event, self._on_exit)
+            monitoring.set_events(tool, events.PY_START | events.PY_RESUME | events.PY_THROW
+                                  | events.PY_RETURN | events.PY_YIELD | events.PY_UNWIND)
+        else:
+            self.running = True                     # before the hook, or it unhooks itself
+            threading.setprofile(self._on_profile)  # threads started from now on
+            sys.setprofile(self._on_profile)        # this thread
+        self.running = True
+        return self
+
+    def stop(self):
+        """Stops recording; frames still open are left out of the totals."""
+        if not self.running:
+            return self
+        monitoring = self._monitoring
+        if monitoring is not None:
+            tool, events = monitoring.PROFILER_ID, monitoring.events
+            monitoring.set_events(tool, 0)
+            for event in (events.PY_START, events.PY_RESUME, events.PY_THROW,
+                          events.PY_RETURN, events.PY_YIELD, events.PY_UNWIND):
+                monitoring.register_callback(tool, event, None)
+            monitoring.free_tool_id(tool)
+        else:
+            sys.setprofile(None)
+            threading.setprofile(None)
+        self.running = False
+        for state in self._threads:                 # next start() begins with empty stacks
+            state.stack.clear()
+            state.active.clear()
+        return self
+
+    def clear(self):
+        """Forgets everything recorded so far (e.g. between two measurement windows)."""
+        self._local = threading.local()             # threads get fresh state on their next event
+        self._threads = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @staticmethod
+    def _name(code):
+        qualname = getattr(code, "co_qualname", code.co_name)
+        return f"{qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def top(self, n=10, by="exclusive"):
+        """[(function, calls, inclusive_ms, exclusive_ms)] for the n hottest functions."""
+        totals = {}
+        for state in list(self._threads):
+            for code, (calls, inclusive, exclusive) in list(state.stats.items()):
+                row = totals.setdefault(code, [0, 0, 0])
+                row[0] += calls
+                row[1] += inclusive
+                row[2] += exclusive
+        column = {"calls": 0, "inclusive": 1, "exclusive": 2}[by]
+        hottest = sorted(totals.items(), key=lambda item: item[1][column], reverse=True)[:n]
+        return [(self._name(code), calls, round(inclusive / 1e6, 3), round(exclusive / 1e6, 3))
+                for code, (calls, inclusive, exclusive) in hottest]
+
+    def collapsed(self):
+        """{"outer;inner;leaf": exclusive ns} merged over all threads."""
+        folded = {}
+        for state in list(self._threads):
+            paths = {0: ""}
+            for (parent, code), node in sorted(state.nodes.items(), key=lambda item: item[1]):
+                name = self._name(code).replace(";", ":")
+                paths[node] = f"{paths[parent]};{name}" if parent else name
+                if state.self_ns[node - 1]:
+                    folded[paths[node]] = folded.get(paths[node], 0) + state.self_ns[node - 1]
+        return folded
+
+    def write_collapsed(self, path):
+        """Writes one "stack value" line per stack (flamegraph.pl, speedscope, ...)."""
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, value in sorted(self.collapsed().items()):
+                file.write(f"{stack} {value}\n")
+
+def parse_row(line):
+    return line.split(",")
+
+def total_amount(lines):
+    return sum(int(parse_row(line)[1]) for line in lines)
+
+tracer = HotPathTracer()
+rows = [f"item{i},{i}" for i in range(20_000)]
+with tracer:                                    # or tracer.start() ... tracer.stop()
+    total_amount(rows)
+for row in tracer.top(3):
+    print("🔥", row)
+# Output (Python 3.12, times in ms vary):
+# 🔥 ('total_amount.<locals>.<genexpr> (day8.py:1006)', 1, 73.7, 54.2)
+# 🔥 ('total_amount (day8.py:1005)', 1, 107.6, 33.8)
+# 🔥 ('parse_row (day8.py:1002)', 20000, 19.6, 19.6)
+tracer.write_collapsed("hot_paths.folded")      # flamegraph.pl hot_paths.folded > hot.svg
+
+# ✅ When to use:
+# - Finding hot functions in a long-running service: start() for a few seconds, stop(), inspect.
+# - cProfile for one-off deep dives; this for switching on in production.
+
+
+# ------------------------------------------------------------
+# 🔹 12. BYTECODE COST – COMPARE REWRITES OF THE SAME FUNCTION
+# ------------------------------------------------------------
+# "Is the comprehension really faster than the loop?" → measure, don't guess.
+# compare_variants() runs every implementation with the same arguments and reports:
+# - static opcode mix   → what dis.get_instructions() finds in the code,
+# - executed opcodes    → instructions actually run per call (callees included),
+#                         via sys.monitoring INSTRUCTION events (3.12+) or
+#                         sys.settrace + f_trace_opcodes on older Pythons
+#                         (only the calling thread is counted),
+# - allocations         → peak / leftover bytes per call (tracemalloc),
+# - wall time           → timeit with auto-calibrated repetitions, best of `repeat`,
+#                         minus the cost of an empty call.
+# The variants must return the same result (checked), otherwise it's not a rewrite.
+
+import timeit
+import tracemalloc
+from collections import Counter
+
+
+def opcode_mix(func):
+    """Counter of opcode names in func's bytecode (nested lambdas/comprehensions included)."""
+    mix = Counter()
+    codes = [func.__code__]
+    while codes:
+        code = codes.pop()
+        mix.update(instruction.opname for instruction in dis.get_instructions(code))
+        codes.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+    return mix
+
+
+def executed_opcodes(func, *args, **kwargs):
+    """Runs func(*args, **kwargs) once → Counter of the opcodes it executed."""
+    executed = Counter()
+    opnames = {}                                    # code object → {offset: opname}
+    caller = sys._getframe().f_code                 # our own instructions are not counted
+    monitoring = getattr(sys, "monitoring", None)
+    if monitoring is not None:
+        tool = next((i for i in range(6) if monitoring.get_tool(i) is None), None)
+        if tool is None:
+            raise RuntimeError("All sys.monitoring tool ids are in use.")
+
+        def on_instruction(code, offset):
+            if code is not caller:
+                table = opnames.get(code)
+                if table is None:
+                    table = opnames[code] = {ins.offset: ins.opname for ins in dis.get_instructions(code)}
+                executed[table.get(offset, "?")] += 1
+
+        monitoring.use_tool_id(tool, "executed_opcodes")
+        monitoring.register_callback(tool, monitoring.events.INSTRUCTION, on_instruction)
+        monitoring.set_events(tool, monitoring.events.INSTRUCTION)
+        try:
+            func(*args, **kwargs)
+        finally:
+            monitoring.set_events(tool, 0)
+            monitoring.register_callback(tool, monitoring.events.INSTRUCTION, None)
+            monitoring.free_tool_id(tool)
+    else:
+        def on_trace(frame, event, arg):
+            if event == "call":
+                frame.f_trace_opcodes = True        # ask for one "opcode" event per instruction
+            elif event == "opcode":
+                executed[dis.opname[frame.f_code.co_code[frame.f_lasti]]] += 1
+            return on_trace
+
+        previous = sys.gettrace()
+        sys.settrace(on_trace)
+        try:
+            func(*args, **kwargs)
+        finally:
+            sys.settrace(previous)
+    return executed
+
+
+def _allocations(func, args, kwargs):
+    """(peak bytes, bytes still held incl. the result) for one call, via tracemalloc."""
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = func(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+        return peak - before, current - before
+    finally:
+        if not tracing:                             # leave an already running tracemalloc alone
+            tracemalloc.stop()
+
+
+def _time_per_call(func, args, kwargs, repeat):
+    """Best wall time of one call in ns, with timeit choosing the loop count."""
+    timer = timeit.Timer(lambda: func(*args, **kwargs))
+    number, _ = timer.autorange()                   # enough loops to run ≥ 0.2 s
+    best = min(timer.repeat(repeat, number)) / number
+    empty = timeit.Timer(lambda: None)              # calibration: cost of the lambda call itself
+    overhead = min(empty.repeat(repeat, number)) / number
+    return max(best - overhead, 0) * 1e9
+
+
+def compare_variants(*funcs, args=(), kwargs=None, repeat=5, check=True):
+    """Measures each implementation → one dict of results per function."""
+    kwargs = kwargs or {}
+    if check:
+        expected = funcs[0](*args, **kwargs)
+        for func in funcs[1:]:
+            if func(*args, **kwargs) != expected:
+                raise ValueError(f"{func.__qualname__} returns a different result than {funcs[0].__qualname__}.")
+    rows = []
+    for func in funcs:
+        executed = executed_opcodes(func, *args, **kwargs)
+        peak, kept = _allocations(func, args, kwargs)
+        rows.append({"name": func.__qualname__, "static": opcode_mix(func), "executed": executed,
+                     "instructions": sum(executed.values()), "peak_bytes": peak, "kept_bytes": kept,
+                     "ns_per_call": _time_per_call(func, args, kwargs, repeat)})
+    return rows
+
+
+def format_comparison(rows, top=6):
+    """Side-by-side text table: one column per variant."""
+    width = max(14, *(len(row["name"]) + 2 for row in rows))
+    lines = [f"{'':<24}" + "".join(f"{row['name']:>{width}}" for row in rows)]
+
+    def line(label, values):
+        lines.append(f"{label:<24}" + "".join(f"{value:>{width}}" for value in values))
+
+    line("wall time / call", [f"{row['ns_per_call'] / 1000:,.1f} µs" for row in rows])
+    line("instructions / call", [f"{row['instructions']:,}" for row in rows])
+    line("static instructions", [f"{sum(row['static'].values()):,}" for row in rows])
+    line("peak alloc / call", [f"{row['peak_bytes']:,} B" for row in rows])
+    line("kept (with result)", [f"{row['kept_bytes']:,} B" for row in rows])
+    busiest = sum((row["executed"] for row in rows), Counter()).most_common(top)
+    for opname, _ in busiest:                       # executed opcodes that dominate any variant
+        line(f"  {opname}", [f"{row['executed'][opname]:,}" for row in rows])
+    return "\n".join(lines)
+
+def squares_loop(n):
+    result = []
+    for x in range(n):
+        result.append(x * x)
+    return result
+
+def squares_comprehension(n):
+    return [x * x for x in range(n)]
+
+def squares_map(n):
+    return list(map(int.__mul__, range(n), range(n)))
+
+# timeit runs every variant for ~1 s → only when this file is run directly
+if __name__ == "__main__":
+    print(format_comparison(compare_variants(squares_loop, squares_comprehension, squares_map, args=(1000,), repeat=3)))
+    # Output (Python 3.12, times vary):
+    #                                    squares_loop  squares_comprehension            squares_map
+    # wall time / call                        82.2 µs                73.8 µs               260.4 µs
+    # instructions / call                      10,009                  7,012                     13
+    # static instructions                          20                     25                     14
+    # peak alloc / call                      40,328 B               40,328 B               40,504 B
+    # kept (with result)                     40,256 B               40,256 B               40,312 B
+    #   LOAD_FAST                               3,002                  2,001                      2
+    #   STORE_FAST                              1,001                  1,001                      0
+    #   ...
+    #   CALL                                    1,001                      1                      4
+    # → the comprehension skips 1,000 result.append() calls; map() runs almost no bytecode
+    #   but is SLOWER: int.__mul__ is a slot wrapper call per item. Fewer opcodes ≠ faster → time it.
+
+# ✅ When to use:
+# - Choosing between rewrites of a hot loop with evidence (opcodes, allocations AND time).
+# - Checking that an "optimization" still returns the same result (check=True).
+
+# ------------------------------------------------------------
+# 🔹 13. GC PAUSES – MONITOR & TUNE THE GARBAGE COLLECTOR
+# ------------------------------------------------------------
+# gc.collect() above is rarely needed, but AUTOMATIC collections matter:
+# a generation-2 collection scans every tracked object → with a big heap
+# (caches, loaded data) it can stop the program for tens of milliseconds.
+# GCMonitor hooks gc.callbacks ("start"/"stop" of every collection) and records
+# per generation: a pause histogram (LatencyHistogram from §9) and objects collected.
+# tune_gc() then replays a workload under different gc.set_threshold() values
+# and with / without gc.freeze() (objects created so far are moved to a
+# permanent generation → never scanned again) and compares the pauses.
+
+
+class GCMonitor:
+    """Records the pause, generation and objects collected of every GC run."""
+
+    def __init__(self, recent=1000):
+        self.pauses = {generation: LatencyHistogram() for generation in range(3)}
+        self.collected = [0, 0, 0]
+        self.uncollectable = [0, 0, 0]
+        self.recent = deque(maxlen=recent)          # (time.time(), generation, pause_ns, collected)
+        self.running = False
+        self._started = None
+
+    def _on_gc(self, phase, info):
+        now = time.perf_counter_ns()
+        if phase == "start":
+            self._started = now
+        elif self._started is not None:             # "stop" (ignored if started before start())
+            pause = now - self._started
+            self._started = None
+            generation = info["generation"]
+            self.pauses[generation].record(pause)
+            self.collected[generation] += info["collected"]
+            self.uncollectable[generation] += info["uncollectable"]
+            self.recent.append((time.time(), generation, pause, info["collected"]))
+
+    def start(self):
+        if not self.running:
+            gc.callbacks.append(self._on_gc)
+            self.running = True
+        return self
+
+    def stop(self):
+        if self.running:
+            gc.callbacks.remove(self._on_gc)
+            self.running = False
+            self._started = None
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def summary(self):
+        """{generation: {count, mean/p50/p90/p99/max pause in ns, total_ms, collected}}"""
+        return {generation: {**histogram.summary(), "total_ms": round(histogram.total / 1e6, 3),
+                             "collected": self.collected[generation],
+                             "uncollectable": self.uncollectable[generation]}
+                for generation, histogram in self.pauses.items()}
+
+
+def tune_gc(workload, thresholds=((700, 10, 10), (10_000, 10, 10), (50_000, 20, 20)),
+            strategies=("none", "freeze")):
+    """Runs workload() once per (threshold, strategy) → one result dict per run."""
+    for strategy in strategies:
+        if strategy not in ("none", "freeze"):
+            raise ValueError("strategy must be 'none' or 'freeze'.")
+    frozen = gc.get_freeze_count()
+    if "freeze" in strategies and frozen:
+        # gc.unfreeze() after a run would also unfreeze these, and there is no way
+        # to freeze only them again → refuse instead of changing the caller's heap.
+        raise ValueError(f"'freeze' needs an unfrozen heap: {frozen} objects are already "
+                         "frozen (use strategies=('none',) or measure before gc.freeze()).")
+    results = []
+    original = gc.get_threshold()
+    for threshold in thresholds:
+        for strategy in strategies:
+            gc.collect()                            # every run starts from the same clean heap
+            if strategy == "freeze":
+                gc.freeze()                         # everything alive now → permanent generation
+            gc.set_threshold(*threshold)
+            try:
+                with GCMonitor() as monitor:
+                    start = time.perf_counter_ns()
+                    workload()
+                    wall = time.perf_counter_ns() - start
+            finally:
+                gc.set_threshold(*original)
+                if strategy == "freeze":
+                    gc.unfreeze()                   # only our freeze (checked above) → oldest generation
+            pauses = LatencyHistogram()
+            for histogram in monitor.pauses.values():
+                pauses.merge(histogram)
+            results.append({"threshold": threshold, "strategy": strategy,
+                            "wall_ms": round(wall / 1e6, 1),
+                            "collections": tuple(monitor.pauses[g].count for g in range(3)),
+                            "pause_ms": round(pauses.total / 1e6, 1),
+                            "p99_ms": round(pauses.percentiles(99)[0] / 1e6, 2),
+                            "max_ms": round(pauses.max / 1e6, 2)})
+    return results
+
+def handle_requests():
+    sessions = []
+    for i in range(200_000):
+        request = {"id": i, "headers": {}}
+        request["self"] = request                   # reference cycle → only the GC frees it
+        sessions.append({"user": i, "roles": []})    # survives → ends up in generation 2
+
+# 7 runs of a 200,000-object workload (~2 s) → only when this file is run directly
+if __name__ == "__main__":
+    long_lived = [{"id": i, "tags": [i]} for i in range(200_000)]   # e.g. a cache loaded at startup
+    with GCMonitor() as monitor:
+        handle_requests()
+    for generation, stats in monitor.summary().items():
+        print("🗑️ gen", generation, stats["count"], "runs, max pause", stats["max_ns"] // 1000, "µs")
+    # Output (Python 3.12, times vary):
+    # 🗑️ gen 0 938 runs, max pause 2014 µs
+    # 🗑️ gen 1 85 runs, max pause 602 µs
+    # 🗑️ gen 2 3 runs, max pause 107694 µs   ← the spike: every tracked object is scanned
+
+    for row in tune_gc(handle_requests):
+        print(row)
+    # Output (Python 3.12, times vary):
+    # {'threshold': (700, 10, 10), 'strategy': 'none', 'wall_ms': 635.7, 'collections': (937, 85, 3), 'pause_ms': 466.9, 'p99_ms': 0.39, 'max_ms': 188.39}
+    # {'threshold': (700, 10, 10), 'strategy': 'freeze', 'wall_ms': 509.9, 'collections': (935, 84, 5), 'pause_ms': 346.4, 'p99_ms': 0.35, 'max_ms': 92.17}
+    # {'threshold': (10000, 10, 10), 'strategy': 'none', 'wall_ms': 315.8, 'collections': (73, 6, 0), 'pause_ms': 154.3, 'p99_ms': 14.45, 'max_ms': 14.45}
+    # ...
+    # → freeze() halves the worst pause (the cache is no longer scanned);
+    #   threshold 10,000 avoids generation 2 here but makes every young collection slower.
+    del long_lived
+
+# ✅ When to use:
+# - Latency spikes you cannot explain → check GCMonitor's generation-2 pauses first.
+# - gc.freeze() after loading long-lived data (or before forking workers);
+#   higher thresholds → fewer but longer pauses. Measure with tune_gc() before changing.
+
+# ------------------------------------------------------------
+# 🧠 14. INTERVIEW QUICK RECAP
 # ------------------------------------------------------------
 # ✅ Decorators → Add extra behavior to functions
+# ✅ log_calls → sampled, lazily formatted logging off the hot path
+# ✅ @timed + log-bucket histograms → p50/p90/p99 with fixed memory
+# ✅ memoize → reuse results (LRU + TTL + byte budget, async-aware)
+# ✅ sys.monitoring tracer → hot functions + flamegraph stacks, switchable at runtime
+# ✅ compare_variants → opcodes executed, allocations and time of rewrites side by side
 # ✅ Generators → Yield values one at a time (save memory)
 # ✅ Asyncio → Run I/O tasks concurrently (non-blocking)
+# ✅ asyncio.to_thread → run blocking file I/O without freezing the loop
 # ✅ Testing & Mocking → Ensure correctness + simulate real cases
 # ✅ Bytecode → Internal Python translation of your code
 # ✅ Garbage Collection → Automatic memory cleanup
+# ✅ GCMonitor / tune_gc → GC pause histograms, thresholds and gc.freeze() measured
 # ✅ Pythonic Tips → Clean, readable, efficient code
 
 # ------------------------------------------------------------
-# 🧩 8. FINAL SOFTWARE ENGINEERING TIPS
+# 🧩 15. FINAL SOFTWARE ENGINEERING TIPS
 # ------------------------------------------------------------
 # - Follow PEP-8 (Python style guide)
 # - Write modular, testable code